@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+"""Record types shared across the extraction pipeline."""
+
+
+
+@dataclass(slots=True)
+class Contact:
+    """A single contact record.
+
+    Slotted to keep per-record memory flat compared to a dict with the
+    same four fixed keys; empty string means the field was not found.
+    """
+    name: str = ''
+    email: str = ''
+    phone: str = ''
+    source_url: str = ''
@@ -1,21 +1,29 @@
+from functools import lru_cache
+from typing import List
+
+from .models import Contact
 from .utils import canonical_phone
 
 """Normalization helpers for contact data."""
 
 
 
+@lru_cache(maxsize=4096)
 def normalize_name(name: str) -> str:
     """Collapse whitespace and convert to Title Case.
-    
+
+    Memoized: contact names repeat across pages of the same site.
+
     Args:
         name: Raw name string
-        
+
     Returns:
         Normalized name in Title Case
     """
     return ' '.join(name.split()).title()
 
 
+@lru_cache(maxsize=4096)
 def normalize_email(email: str) -> str:
     """Strip whitespace and convert to lowercase.
     
@@ -40,24 +48,42 @@ def normalize_phone(phone: str) -> str:
     return canonical_phone(phone)
 
 
-def normalize_record(r: dict) -> dict:
-    """Normalize all fields in a contact record.
-    
+def normalize_record(r: Contact) -> Contact:
+    """Normalize all fields of a contact record in place.
+
     Args:
-        r: Dictionary containing contact fields (name, email, phone, source_url)
-        
+        r: Contact record with fields name, email, phone, source_url
+
     Returns:
-        New dictionary with normalized field values
+        The same Contact, mutated; returned for call-site convenience
     """
-    normalized = {}
-    
-    if 'name' in r:
-        normalized['name'] = normalize_name(r['name'])
-    if 'email' in r:
-        normalized['email'] = normalize_email(r['email'])
-    if 'phone' in r:
-        normalized['phone'] = normalize_phone(r['phone'])
-    if 'source_url' in r:
-        normalized['source_url'] = r['source_url'].strip()
-    
-    return normalized
\ No newline at end of file
+    r.name = normalize_name(r.name)
+    r.email = normalize_email(r.email)
+    r.phone = normalize_phone(r.phone)
+    r.source_url = r.source_url.strip()
+    return r
+
+
+def normalize_records(records: List[Contact]) -> List[Contact]:
+    """Normalize a batch of contact records in place, one pass per column.
+
+    Column-wise passes keep each memoized helper's cache hot and avoid
+    per-record dispatch overhead compared to calling normalize_record in
+    a loop; mutating in place avoids reallocating every record.
+
+    Args:
+        records: List of Contact records
+
+    Returns:
+        The same list, with each Contact mutated
+    """
+    for r in records:
+        r.name = normalize_name(r.name)
+    for r in records:
+        r.email = normalize_email(r.email)
+    for r in records:
+        r.phone = normalize_phone(r.phone)
+    for r in records:
+        r.source_url = r.source_url.strip()
+
+    return records
\ No newline at end of file
@@ -1,112 +1,226 @@
 import re
-from typing import List, Dict, Optional, Set, Tuple
-from bs4 import BeautifulSoup, Tag
+from bisect import bisect_right
+from typing import List, Dict, Tuple
+import re2 as _re2
+from lxml import etree
+from lxml import html as lxml_html
+from selectolax.lexbor import LexborHTMLParser
+
+from .models import Contact
+from .utils import record_key
 
 """
-Parser module for extracting contact information from HTML using BeautifulSoup and regex.
+Parser module for extracting contact information from HTML using lxml and regex.
 """
 
 
 
-# Robust regex patterns for contact extraction
-EMAIL_RE = re.compile(
-    r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-    re.IGNORECASE
+# Robust regex patterns for contact extraction, compiled with the linear-time
+# re2 engine so long numeric runs cannot trigger backtracking blowups.
+# google-re2 does not accept stdlib flag objects, so case-insensitivity is
+# expressed inline with (?i).
+EMAIL_RE = _re2.compile(
+    r'(?i)\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
 )
 
-PHONE_RE = re.compile(
-    r'(?:\+?\d{1,3}[\s.-]?)?'  # Optional country code
-    r'(?:\(?\d{2,4}\)?[\s.-]?)?'  # Optional area code
-    r'\d{3,4}[\s.-]?\d{3,4}(?:[\s.-]?\d{1,4})?',  # Main number
-    re.IGNORECASE
+# Characters that may appear inside a phone-like run besides digits
+_PHONE_SEPARATORS = '+- .()'
+
+# Pattern for extracting names from text like "Name: John Doe" or "Contact - Jane Roe".
+# Whitespace is line-confined ([ \t] rather than \s) so that whole-text sweeps
+# cannot stitch a name together across newlines, and only the keyword is
+# case-insensitive so lowercase filler ("contact us at ...") is not captured
+# as a name
+NAME_PATTERN = _re2.compile(
+    r'(?i:name|contact|person)[ \t:=-]+([A-Z][a-z]+(?:[ \t]+[A-Z][a-z]+)+)'
+)
+
+# Mailto scheme prefix, compiled once instead of per call
+MAILTO_RE = re.compile(r'^mailto:', re.IGNORECASE)
+
+# EXSLT regular-expressions namespace for regex matching inside XPath
+_REGEX_NS = {'re': 'http://exslt.org/regular-expressions'}
+
+# Mailto anchors, matched case-insensitively on the scheme prefix. This is
+# the CSS selector a[href^="mailto:"] compiled to XPath by hand: cssselect
+# produces the same starts-with() expression but cannot express the
+# case-insensitive `i` attribute flag, so the translate() folding stays
+_MAILTO_XPATH = etree.XPath(
+    './/a[starts-with(translate(@href, "MAILTO:", "mailto:"), "mailto:")]'
 )
 
-# Pattern for extracting names from text like "Name: John Doe" or "Contact - Jane Roe"
-NAME_PATTERN = re.compile(
-    r'(?:name|contact|person)[\s:=-]+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)',
-    re.IGNORECASE
+# Elements whose class or id hints at contact data; one compiled XPath
+# replaces a separate tree walk per semantic pattern
+_SEMANTIC_PATTERNS = ['name', 'fullname', 'contact', 'email', 'phone', 'tel', 'mobile']
+SEMANTIC_RE = re.compile(
+    r'(fullname|name|contact|email|phone|tel|mobile)', re.IGNORECASE
+)
+_SEMANTIC_XPATH = etree.XPath(
+    './/*[re:test(@class, "{0}", "i") or re:test(@id, "{0}", "i")]'.format(
+        '|'.join(_SEMANTIC_PATTERNS)
+    ),
+    namespaces=_REGEX_NS
 )
 
 
-def extract_contacts(html: str, source_url: str) -> List[Dict]:
+def _parse(html: str) -> lxml_html.HtmlElement:
+    """Parse raw HTML into an lxml element tree.
+
+    Raises:
+        lxml.etree.ParserError: If the document yields no element at all
+    """
+    try:
+        return lxml_html.fromstring(html)
+    except ValueError:
+        # lxml refuses str input carrying an XML encoding declaration
+        # (XHTML with an <?xml ...?> prolog); re-parse as bytes so it
+        # honors the declaration itself. The prolog also confuses
+        # fromstring's fragment sniffing, so parse as a full document
+        return lxml_html.document_fromstring(html.encode())
+
+
+def _page_text(html: str) -> str:
+    """Extract the page's flat text with lexbor, one element per line."""
+    root = LexborHTMLParser(html).root
+    return root.text(separator='\n') if root is not None else ''
+
+
+def _scan_phones(text: str):
+    """Yield (start, phone) for each phone-like run in text.
+
+    Single forward scan: a run opens on a digit (or a '+'/'(' directly
+    before one), continues through digits and common separators, and is
+    kept when it contains 7 to 15 digits. Unlike the old ambiguous
+    PHONE_RE there is no backtracking on long numeric strings, and runs
+    never cross characters outside the separator set (including newlines).
+    """
+    i = 0
+    n = len(text)
+
+    while i < n:
+        c = text[i]
+        if not (c.isdigit() or (c in '+(' and i + 1 < n and text[i + 1].isdigit())):
+            i += 1
+            continue
+
+        start = i
+        digit_count = 0
+        while i < n and (text[i].isdigit() or text[i] in _PHONE_SEPARATORS):
+            if text[i].isdigit():
+                digit_count += 1
+            i += 1
+
+        if 7 <= digit_count <= 15:
+            yield start, text[start:i].rstrip(_PHONE_SEPARATORS)
+
+
+def find_phones(text: str) -> List[str]:
+    """Find phone-like numbers in text, in order of appearance.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        List of phone number strings with 7 to 15 digits each
+    """
+    return [phone for _, phone in _scan_phones(text)]
+
+
+def extract_contacts(html: str, source_url: str) -> List[Contact]:
     """
     Extract contact information from HTML content.
-    
+
     Args:
         html: Raw HTML content as string
         source_url: URL of the source page
-        
+
     Returns:
-        List of contact dictionaries with keys: name, email, phone, source_url
+        List of Contact records with name, email, phone, and source_url set
     """
-    soup = BeautifulSoup(html, 'lxml')
-    
-    # Combine both extraction strategies
-    structured = _extract_structured(soup)
-    text_based = _extract_candidates_via_text(soup)
-    
+    # Cheap pre-filter: a page with no '@' anywhere and essentially no
+    # digits up front can yield neither emails nor phones, so skip the
+    # parse and all three extraction passes for it
+    if '@' not in html and sum(c.isdigit() for c in html[:8192]) < 7:
+        return []
+
+    # Comment-only or otherwise markup-free documents produce no tree at
+    # all; treat them as having no contacts
+    try:
+        tree = _parse(html)
+    except etree.ParserError:
+        return []
+
+    # Combine both extraction strategies; the text sweep gets its flat text
+    # from lexbor, which extracts it far faster than walking the lxml tree
+    structured = _extract_structured(tree)
+    text_based = _extract_candidates_via_text(_page_text(html))
+
     # Merge all contacts
     all_contacts = structured + text_based
-    
-    # Deduplicate using tuple of (name, email, phone)
-    seen: Set[Tuple[Optional[str], Optional[str], Optional[str]]] = set()
-    unique_contacts = []
-    
+
+    # Deduplicate with the same canonical (email, phone) key the rest of the
+    # pipeline uses, so records leave the parser already unique
+    unique: Dict[Tuple[str, str], Contact] = {}
+
     for contact in all_contacts:
-        key = (
-            contact.get('name', '').strip().lower() if contact.get('name') else None,
-            contact.get('email', '').strip().lower() if contact.get('email') else None,
-            contact.get('phone', '').strip() if contact.get('phone') else None
-        )
-        
+        key = record_key(contact)
+
         # Skip if all fields are empty or if already seen
-        if not any(key) or key in seen:
+        if key == ('', '') and not contact.name.strip():
             continue
-            
-        seen.add(key)
-        contact['source_url'] = source_url
-        unique_contacts.append(contact)
-    
-    return unique_contacts
+        if key in unique:
+            continue
+
+        contact.source_url = source_url
+        unique[key] = contact
 
+    return list(unique.values())
 
-def _extract_structured(soup: BeautifulSoup) -> List[Dict]:
+
+def _extract_structured(tree: lxml_html.HtmlElement) -> List[Contact]:
     """
     Extract contacts from structured HTML elements like tables and mailto links.
-    
+
     Args:
-        soup: BeautifulSoup parsed HTML
-        
+        tree: lxml-parsed HTML tree
+
     Returns:
-        List of contact dictionaries
+        List of Contact records
     """
     contacts = []
-    
+
     # Strategy 1: Extract from tables
-    contacts.extend(_extract_from_tables(soup))
-    
+    contacts.extend(_extract_from_tables(tree))
+
     # Strategy 2: Extract mailto links
-    contacts.extend(_extract_mailto_links(soup))
-    
+    contacts.extend(_extract_mailto_links(tree))
+
     # Strategy 3: Extract from semantic elements
-    contacts.extend(_extract_semantic_elements(soup))
-    
+    contacts.extend(_extract_semantic_elements(tree))
+
     return contacts
 
 
-def _extract_from_tables(soup: BeautifulSoup) -> List[Dict]:
+def _extract_from_tables(tree: lxml_html.HtmlElement) -> List[Contact]:
     """Extract contacts from HTML tables."""
     contacts = []
-    
-    for table in soup.find_all('table'):
-        rows = table.find_all('tr')
+
+    for table in tree.xpath('.//table'):
+        rows = table.xpath('.//tr')
         if not rows:
             continue
-            
+
+        # Read every cell's text exactly once up front; header detection and
+        # the extraction paths below all index into these lists, so no row
+        # (including a header row reprocessed as data) walks its cells twice
+        row_texts = [
+            [cell.text_content().strip() for cell in row.xpath('./td|./th')]
+            for row in rows
+        ]
+
         # Try to detect header row
-        header_row = rows[0]
-        headers = [th.get_text(strip=True).lower() for th in header_row.find_all(['th', 'td'])]
-        
+        headers = [text.lower() for text in row_texts[0]]
+
         # Map column indices
         name_idx = email_idx = phone_idx = None
         for idx, header in enumerate(headers):
@@ -116,128 +230,128 @@ def _extract_from_tables(soup: BeautifulSoup) -> List[Dict]:
                 email_idx = idx
             elif 'phone' in header or 'tel' in header or 'mobile' in header:
                 phone_idx = idx
-        
+
         # Process data rows
         start_idx = 1 if any([name_idx, email_idx, phone_idx]) else 0
-        for row in rows[start_idx:]:
-            cells = row.find_all(['td', 'th'])
-            if not cells:
+        for cell_texts in row_texts[start_idx:]:
+            if not cell_texts:
                 continue
-                
-            contact = {}
-            
+
+            contact = Contact()
+
             # Extract based on column mapping
-            if name_idx is not None and name_idx < len(cells):
-                contact['name'] = cells[name_idx].get_text(strip=True)
-            if email_idx is not None and email_idx < len(cells):
-                contact['email'] = cells[email_idx].get_text(strip=True)
-            if phone_idx is not None and phone_idx < len(cells):
-                contact['phone'] = cells[phone_idx].get_text(strip=True)
-            
+            if name_idx is not None and name_idx < len(cell_texts):
+                contact.name = cell_texts[name_idx]
+            if email_idx is not None and email_idx < len(cell_texts):
+                contact.email = cell_texts[email_idx]
+            if phone_idx is not None and phone_idx < len(cell_texts):
+                contact.phone = cell_texts[phone_idx]
+
             # Fallback: search all cells for patterns
-            for cell in cells:
-                text = cell.get_text(strip=True)
-                if not contact.get('email'):
+            for text in cell_texts:
+                if not contact.email:
                     email_match = EMAIL_RE.search(text)
                     if email_match:
-                        contact['email'] = email_match.group(0)
-                if not contact.get('phone'):
-                    phone_match = PHONE_RE.search(text)
-                    if phone_match:
-                        contact['phone'] = phone_match.group(0)
-            
-            if contact:
+                        contact.email = email_match.group(0)
+                if not contact.phone:
+                    phones = find_phones(text)
+                    if phones:
+                        contact.phone = phones[0]
+
+            if contact.name or contact.email or contact.phone:
                 contacts.append(contact)
-    
+
     return contacts
 
 
-def _extract_mailto_links(soup: BeautifulSoup) -> List[Dict]:
+def _extract_mailto_links(tree: lxml_html.HtmlElement) -> List[Contact]:
     """Extract contacts from mailto links."""
     contacts = []
-    
-    for link in soup.find_all('a', href=re.compile(r'^mailto:', re.IGNORECASE)):
-        email = link.get('href', '').replace('mailto:', '').split('?')[0].strip()
-        name = link.get_text(strip=True)
-        
+
+    for link in _MAILTO_XPATH(tree):
+        href = link.get('href', '')
+        email = MAILTO_RE.sub('', href).split('?')[0].strip()
+        name = link.text_content().strip()
+
         if EMAIL_RE.match(email):
-            contact = {'email': email}
+            contact = Contact(email=email)
             if name and name != email:
-                contact['name'] = name
+                contact.name = name
             contacts.append(contact)
-    
+
     return contacts
 
 
-def _extract_semantic_elements(soup: BeautifulSoup) -> List[Dict]:
+def _extract_semantic_elements(tree: lxml_html.HtmlElement) -> List[Contact]:
     """Extract contacts from elements with semantic class/id names."""
     contacts = []
-    semantic_patterns = ['name', 'fullname', 'contact', 'email', 'phone', 'tel', 'mobile']
-    
-    for pattern in semantic_patterns:
-        # Find by class or id
-        elements = soup.find_all(class_=re.compile(pattern, re.IGNORECASE))
-        elements.extend(soup.find_all(id=re.compile(pattern, re.IGNORECASE)))
-        
-        for elem in elements:
-            text = elem.get_text(strip=True)
-            contact = {}
-            
-            if 'email' in pattern or 'mail' in pattern:
-                email_match = EMAIL_RE.search(text)
-                if email_match:
-                    contact['email'] = email_match.group(0)
-            elif 'phone' in pattern or 'tel' in pattern or 'mobile' in pattern:
-                phone_match = PHONE_RE.search(text)
-                if phone_match:
-                    contact['phone'] = phone_match.group(0)
-            elif 'name' in pattern or 'contact' in pattern:
-                if text and len(text) > 2:
-                    contact['name'] = text
-            
-            if contact:
-                contacts.append(contact)
-    
+
+    # One compiled XPath pass collects every candidate element; a single
+    # combined regex on the class/id strings then decides which field the
+    # element hints at, instead of testing seven patterns per element
+    for elem in _SEMANTIC_XPATH(tree):
+        attr_text = ' '.join(
+            value for value in (elem.get('class'), elem.get('id')) if value
+        )
+
+        match = SEMANTIC_RE.search(attr_text)
+        if not match:
+            continue
+
+        kind = match.group(1).lower()
+        text = elem.text_content().strip()
+        contact = Contact()
+
+        if kind == 'email':
+            email_match = EMAIL_RE.search(text)
+            if email_match:
+                contact.email = email_match.group(0)
+        elif kind in ('phone', 'tel', 'mobile'):
+            phones = find_phones(text)
+            if phones:
+                contact.phone = phones[0]
+        else:  # name, fullname, contact
+            if text and len(text) > 2:
+                contact.name = text
+
+        if contact.name or contact.email or contact.phone:
+            contacts.append(contact)
+
     return contacts
 
 
-def _extract_candidates_via_text(soup: BeautifulSoup) -> List[Dict]:
+def _extract_candidates_via_text(text: str) -> List[Contact]:
     """
     Extract contacts using regex patterns on raw text content.
-    
+
     Args:
-        soup: BeautifulSoup parsed HTML
-        
+        text: Flat text content of the page
+
     Returns:
-        List of contact dictionaries
+        List of Contact records
     """
-    contacts = []
-    text = soup.get_text()
-    lines = text.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        
-        contact = {}
-        
-        # Extract email
-        email_match = EMAIL_RE.search(line)
-        if email_match:
-            contact['email'] = email_match.group(0)
-        
-        # Extract phone
-        phone_match = PHONE_RE.search(line)
-        if phone_match:
-            contact['phone'] = phone_match.group(0)
-        
-        # Extract name using heuristic patterns
-        name_match = NAME_PATTERN.search(line)
-        if name_match:
-            contact['name'] = name_match.group(1).strip()
-        
-        if contact:
-            contacts.append(contact)
-    
-    return contacts
\ No newline at end of file
+    if not text:
+        return []
+
+    # Cumulative line-start offsets so match positions can be mapped back to
+    # their line with bisect, instead of re-anchoring each regex per line
+    line_starts = [0]
+    for line in text.splitlines(keepends=True):
+        line_starts.append(line_starts[-1] + len(line))
+
+    # Three whole-text sweeps; matches on the same line merge into one
+    # contact, keeping the first hit per field as the line-based scan did
+    by_line: Dict[int, Contact] = {}
+
+    for field, spans in (
+        ('email', ((m.start(), m.group(0)) for m in EMAIL_RE.finditer(text))),
+        ('phone', _scan_phones(text)),
+        ('name', ((m.start(), m.group(1).strip()) for m in NAME_PATTERN.finditer(text))),
+    ):
+        for start, value in spans:
+            line_idx = bisect_right(line_starts, start) - 1
+            contact = by_line.setdefault(line_idx, Contact())
+            if not getattr(contact, field):
+                setattr(contact, field, value)
+
+    return [by_line[idx] for idx in sorted(by_line)]
@@ -1,5 +1,7 @@
 import time
 import logging
+import shelve
+import threading
 from pathlib import Path
 from urllib.parse import urlparse, urljoin
 from urllib.robotparser import RobotFileParser
@@ -11,6 +13,11 @@ Fetcher class for retrieving HTML from HTTP(S) URLs or local file paths.
 """
 
 
+# On-disk robots.txt cache shared across CLI invocations
+ROBOTS_CACHE_PATH = Path.home() / '.cache' / 'contact_scraper' / 'robots.db'
+ROBOTS_CACHE_TTL = 24 * 60 * 60  # seconds
+
+
 
 class Fetcher:
     """
@@ -47,8 +54,25 @@ class Fetcher:
         # Per-host rate limiting
         self._last_request_time: dict[str, float] = {}
         
-        # Robots.txt cache
+        # Robots.txt cache, shared across fetch threads. The global lock only
+        # guards the dicts; the robots.txt fetch itself runs under a per-host
+        # lock so workers for different hosts never serialize on network I/O
         self._robots_cache: dict[str, RobotFileParser] = {}
+        self._robots_host_locks: dict[str, threading.Lock] = {}
+        self._robots_lock = threading.Lock()
+
+        # shelve/dbm files are not safe for concurrent access, so all disk
+        # cache reads and writes serialize behind this lock; the robots.txt
+        # network fetch itself stays outside it
+        self._robots_db_lock = threading.Lock()
+
+        # Pooled session so repeat requests to a host reuse the TCP/TLS
+        # connection instead of redoing DNS and the handshake per URL
+        self._session = requests.Session()
+        self._session.headers.update({
+            'User-Agent': self.user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+        })
     
     def get(self, url: str) -> Tuple[str, str]:
         """
@@ -99,21 +123,17 @@ class Fetcher:
         
         # Rate limiting per host
         self._apply_rate_limit(host)
-        
-        # Prepare headers
-        headers = {
-            'User-Agent': self.user_agent,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
-        }
-        
-        # Make request
-        response = requests.get(url, headers=headers, timeout=20)
+
+        # Make request on the pooled session (headers are set in __init__)
+        response = self._session.get(url, timeout=20)
         response.raise_for_status()
         
-        # Set encoding to apparent_encoding for better detection
-        if response.encoding != response.apparent_encoding:
+        # apparent_encoding runs chardet over the whole body, so only pay for
+        # it when the server declared no charset (requests then falls back to
+        # the bogus ISO-8859-1 default)
+        if not response.encoding or response.encoding.lower() == 'iso-8859-1':
             response.encoding = response.apparent_encoding
-        
+
         return response.text, response.url
     
     def _is_allowed(self, url: str) -> bool:
@@ -122,20 +142,77 @@ class Fetcher:
         base_url = f"{parsed.scheme}://{parsed.netloc}"
         
         # Get or create robots parser for this base URL
-        if base_url not in self._robots_cache:
-            rp = RobotFileParser()
-            robots_url = urljoin(base_url, '/robots.txt')
+        with self._robots_lock:
+            rp = self._robots_cache.get(base_url)
+            if rp is None:
+                host_lock = self._robots_host_locks.setdefault(base_url, threading.Lock())
+
+        if rp is None:
+            with host_lock:
+                # Another caller for this host may have fetched while we waited
+                with self._robots_lock:
+                    rp = self._robots_cache.get(base_url)
+                if rp is None:
+                    rp = self._load_robots(base_url)
+                    with self._robots_lock:
+                        self._robots_cache[base_url] = rp
+
+        return rp.can_fetch(self.user_agent, url)
+
+    def _load_robots(self, base_url: str) -> RobotFileParser:
+        """Build a robots.txt parser for a host, preferring the disk cache."""
+        robots_url = urljoin(base_url, '/robots.txt')
+        rp = RobotFileParser()
+        rp.set_url(robots_url)
+
+        text = self._read_cached_robots(base_url)
+
+        if text is None:
             try:
-                rp.set_url(robots_url)
-                rp.read()
-                self._robots_cache[base_url] = rp
+                response = self._session.get(robots_url, timeout=20)
+                if response.status_code in (401, 403):
+                    rp.disallow_all = True
+                    return rp
+                if 400 <= response.status_code < 500:
+                    # Missing robots.txt allows everything; cache the miss too
+                    text = ''
+                else:
+                    response.raise_for_status()
+                    text = response.text
             except Exception as e:
                 self.logger.debug(f"Failed to fetch robots.txt from {robots_url}: {e}")
                 # If robots.txt can't be fetched, allow by default
                 rp.allow_all = True
-                self._robots_cache[base_url] = rp
-        
-        return self._robots_cache[base_url].can_fetch(self.user_agent, url)
+                return rp
+
+            self._write_cached_robots(base_url, text)
+
+        rp.parse(text.splitlines())
+        return rp
+
+    def _read_cached_robots(self, base_url: str) -> Optional[str]:
+        """Return cached robots.txt text for a host if still fresh."""
+        try:
+            with self._robots_db_lock:
+                with shelve.open(str(ROBOTS_CACHE_PATH)) as db:
+                    entry = db.get(base_url)
+        except Exception as e:
+            self.logger.debug(f"Failed to read robots.txt cache: {e}")
+            return None
+
+        if entry and time.time() - entry['fetched_at'] < ROBOTS_CACHE_TTL:
+            return entry['text']
+        return None
+
+    def _write_cached_robots(self, base_url: str, text: str) -> None:
+        """Persist fetched robots.txt text for reuse by later invocations."""
+        try:
+            ROBOTS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with self._robots_db_lock:
+                with shelve.open(str(ROBOTS_CACHE_PATH)) as db:
+                    db[base_url] = {'text': text, 'fetched_at': time.time()}
+        except Exception as e:
+            self.logger.debug(f"Failed to persist robots.txt cache: {e}")
     
     def _apply_rate_limit(self, host: str) -> None:
         """Apply rate limiting for the given host."""
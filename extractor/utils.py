@@ -1,6 +1,18 @@
 import logging
 import re
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+
+from .models import Contact
+
+# RFC-lite email validation pattern, compiled once at import time
+IS_VALID_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Deletion table stripping every non-digit ASCII character in one C-level pass
+_NON_DIGIT_ASCII = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
+
 
 def setup_logger(debug: bool) -> logging.Logger:
     """
@@ -41,18 +53,20 @@ def is_valid_email(email: str) -> bool:
     """
     if not email:
         return False
-    
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
 
+    return bool(IS_VALID_EMAIL_RE.match(email))
 
+
+@lru_cache(maxsize=4096)
 def canonical_phone(phone: str) -> str:
     """
     Normalize phone number by keeping only leading '+' and digits.
-    
+
+    Results are memoized since the same office numbers repeat across records.
+
     Args:
         phone: Phone number string to normalize
-        
+
     Returns:
         Canonicalized phone number ('+' prefix preserved if present, digits only)
     """
@@ -61,35 +75,49 @@ def canonical_phone(phone: str) -> str:
     
     phone = phone.strip()
     has_plus = phone.startswith('+')
-    digits = ''.join(c for c in phone if c.isdigit())
-    
+    digits = phone.translate(_NON_DIGIT_ASCII)
+
+    # Non-ASCII leftovers (unicode punctuation etc.) are rare; filter them
+    # the slow way only when the fast path didn't fully clean the string
+    if digits and not digits.isdigit():
+        digits = ''.join(c for c in digits if c.isdigit())
+
     return f"+{digits}" if has_plus and digits else digits
 
 
-def dedupe_records(records: List[Dict]) -> List[Dict]:
+def record_key(record: Contact) -> Tuple[str, str]:
+    """
+    Compute the canonical deduplication key for a contact record.
+
+    Args:
+        record: Contact record
+
+    Returns:
+        Tuple of (email.lower(), canonical_phone(phone))
+    """
+    return (record.email.lower(), canonical_phone(record.phone))
+
+
+def dedupe_records(records) -> List[Contact]:
     """
     Remove duplicate records based on normalized email and phone number.
-    
-    Uses (email.lower(), canonical_phone(phone)) as the deduplication key.
-    Keeps the first occurrence of each unique record.
-    
+
+    Uses record_key, i.e. (email.lower(), canonical_phone(phone)), as the
+    deduplication key. Keeps the first occurrence of each unique record.
+    Inputs that are already a dict keyed by record_key pass through as-is.
+
     Args:
-        records: List of contact dictionaries
-        
+        records: List of Contact records, or a dict keyed by record_key
+
     Returns:
         Deduplicated list of records
     """
-    seen = set()
-    unique_records = []
-    
+    if isinstance(records, dict):
+        return list(records.values())
+
+    unique: Dict[Tuple[str, str], Contact] = {}
+
     for record in records:
-        email = (record.get('email') or '').lower()
-        phone = canonical_phone(record.get('phone') or '')
-        
-        key = (email, phone)
-        
-        if key not in seen:
-            seen.add(key)
-            unique_records.append(record)
-    
-    return unique_records
\ No newline at end of file
+        unique.setdefault(record_key(record), record)
+
+    return list(unique.values())
\ No newline at end of file
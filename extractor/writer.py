@@ -1,49 +1,58 @@
 from pathlib import Path
-from typing import Dict, List
-import pandas as pd
+from typing import List
+from openpyxl import Workbook
+
+from .models import Contact
 
 """Writer module for exporting extracted contact data to Excel."""
 
 
 
 
-def write_excel(records: List[Dict], out_path: Path) -> None:
+def write_excel(records: List[Contact], out_path: Path) -> None:
     """
     Write contact records to an Excel file with contacts and summary sheets.
-    
+
     Args:
-        records: List of dictionaries containing contact information.
-                 Expected keys: 'name', 'email', 'phone', 'source_url'
+        records: List of Contact records
         out_path: Path object specifying where to write the Excel file.
-    
+
     The function creates two sheets:
         - 'contacts': All valid contact records
         - 'summary': Metrics including total rows, unique emails, and unique phones
     """
-    # Build DataFrame with specified columns
-    df = pd.DataFrame(records, columns=['name', 'email', 'phone', 'source_url'])
-    
-    # Fill NaN values with empty strings for consistent filtering
-    df = df.fillna('')
-    
-    # Drop rows where name, email, and phone are all empty
-    df = df[~((df['name'] == '') & (df['email'] == '') & (df['phone'] == ''))]
-    
+    # Filter empty rows and collect summary metrics in a single pass
+    rows = []
+    unique_emails = set()
+    unique_phones = set()
+
+    for record in records:
+        # Drop rows where name, email, and phone are all empty
+        if not (record.name or record.email or record.phone):
+            continue
+
+        rows.append((record.name, record.email, record.phone, record.source_url))
+        if record.email:
+            unique_emails.add(record.email)
+        if record.phone:
+            unique_phones.add(record.phone)
+
     # Sort by name, email, phone for readability
-    df = df.sort_values(by=['name', 'email', 'phone'], ignore_index=True)
-    
-    # Calculate summary metrics
-    total_rows = len(df)
-    unique_emails = df[df['email'] != '']['email'].nunique()
-    unique_phones = df[df['phone'] != '']['phone'].nunique()
-    
-    summary_data = {
-        'Metric': ['total_rows', 'unique_emails', 'unique_phones'],
-        'Value': [total_rows, unique_emails, unique_phones]
-    }
-    summary_df = pd.DataFrame(summary_data)
-    
-    # Write to Excel with two sheets using openpyxl engine
-    with pd.ExcelWriter(out_path, engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='contacts', index=False)
-        summary_df.to_excel(writer, sheet_name='summary', index=False)
\ No newline at end of file
+    rows.sort()
+
+    # Write both sheets directly with openpyxl, streaming row by row
+    wb = Workbook()
+
+    contacts_ws = wb.active
+    contacts_ws.title = 'contacts'
+    contacts_ws.append(['name', 'email', 'phone', 'source_url'])
+    for row in rows:
+        contacts_ws.append(row)
+
+    summary_ws = wb.create_sheet('summary')
+    summary_ws.append(['Metric', 'Value'])
+    summary_ws.append(['total_rows', len(rows)])
+    summary_ws.append(['unique_emails', len(unique_emails)])
+    summary_ws.append(['unique_phones', len(unique_phones)])
+
+    wb.save(out_path)
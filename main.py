@@ -1,11 +1,14 @@
 import argparse
 import sys
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from urllib.parse import urlparse
 from extractor.scraper import Fetcher
 from extractor.parser import extract_contacts
-from extractor.normalizer import normalize_record
-from extractor.utils import dedupe_records, setup_logger
+from extractor.normalizer import normalize_records
+from extractor.utils import record_key, setup_logger
 from extractor.writer import write_excel
 
 #!/usr/bin/env python3
@@ -15,6 +18,34 @@ CLI entry point for contact scraper.
 
 
 
+def fetch_host_group(fetcher, sources, delay):
+    """Fetch one host's sources serially so per-host rate limiting holds.
+
+    Args:
+        fetcher: Shared Fetcher instance
+        sources: URLs/paths that all belong to the same host
+        delay: Delay in seconds between requests to this host
+
+    Returns:
+        List of (source, html_text, final_url, error) tuples; error is None
+        on success
+    """
+    results = []
+
+    for idx, source in enumerate(sources, 1):
+        try:
+            html_text, final_url = fetcher.get(source)
+            results.append((source, html_text, final_url, None))
+        except Exception as e:
+            results.append((source, '', '', e))
+
+        # Apply delay between requests (except for last item)
+        if idx < len(sources) and delay > 0:
+            time.sleep(delay)
+
+    return results
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Scrape contact information from URLs or local files."
@@ -79,39 +110,56 @@ def main():
         respect_robots=not args.no_robots
     )
     
-    # Collect all records
-    all_records = []
-    
-    for idx, source in enumerate(sources, 1):
-        logger.info(f"Processing [{idx}/{len(sources)}]: {source}")
-        
-        try:
-            # Fetch content
-            html_text, final_url = fetcher.get(source)
+    # Group sources by host: fetches to different hosts run in parallel,
+    # while each host's URLs stay serial so per-host rate limiting holds
+    by_host = defaultdict(list)
+    for source in sources:
+        by_host[urlparse(source).netloc].append(source)
 
-            if html_text:
-                # Parse contacts
-                contacts = extract_contacts(html_text, final_url)
-                logger.info(f"  Found {len(contacts)} contact(s)")
-
-                # Normalize each record
-                for contact in contacts:
-                    normalized = normalize_record(contact)
-                    all_records.append(normalized)
-                logger.debug("Sample records: %s", all_records[:3])
-            else:
-                logger.warning(f"  No content retrieved from {source}")
-        except Exception as e:
-            logger.error(f"  Error processing {source}: {e}")
-        
-        # Apply delay between requests (except for last item)
-        if idx < len(sources) and args.delay > 0:
-            time.sleep(args.delay)
-    
-    logger.info(f"Collected {len(all_records)} total record(s)")
-    
-    # Deduplicate records
-    unique_records = dedupe_records(all_records)
+    # Collect records keyed by their canonical (email, phone) key, so
+    # deduplication happens as records arrive and each unique contact is
+    # normalized exactly once
+    unique: dict = {}
+    total_records = 0
+    processed = 0
+
+    # Fetch concurrently; parsing stays in this thread since it is CPU-bound
+    with ThreadPoolExecutor(max_workers=min(16, len(by_host))) as executor:
+        futures = [
+            executor.submit(fetch_host_group, fetcher, host_sources, args.delay)
+            for host_sources in by_host.values()
+        ]
+
+        for future in as_completed(futures):
+            for source, html_text, final_url, error in future.result():
+                processed += 1
+                logger.info(f"Processing [{processed}/{len(sources)}]: {source}")
+
+                if error is not None:
+                    logger.error(f"  Error processing {source}: {error}")
+                    continue
+
+                try:
+                    if html_text:
+                        # Parse contacts
+                        contacts = extract_contacts(html_text, final_url)
+                        logger.info(f"  Found {len(contacts)} contact(s)")
+                        total_records += len(contacts)
+
+                        # Normalize the page's new records as one batch; the
+                        # key is unchanged by normalization, so filtering
+                        # first keeps one normalization per unique record
+                        fresh = [c for c in contacts if record_key(c) not in unique]
+                        for record in normalize_records(fresh):
+                            unique.setdefault(record_key(record), record)
+                    else:
+                        logger.warning(f"  No content retrieved from {source}")
+                except Exception as e:
+                    logger.error(f"  Error processing {source}: {e}")
+
+    logger.info(f"Collected {total_records} total record(s)")
+
+    unique_records = list(unique.values())
     logger.info(f"After deduplication: {len(unique_records)} unique record(s)")
     
     # Write to Excel
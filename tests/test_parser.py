@@ -28,9 +28,35 @@ def test_extract_contacts_basic():
     result = parser.extract_contacts(html, source_url='test')
     
     # Extract all emails from results
-    extracted_emails = [contact.get('email') for contact in result if contact.get('email')]
+    extracted_emails = [contact.email for contact in result if contact.email]
     
     # Assert expected emails are present
     assert 'alice@example.com' in extracted_emails
     assert 'bob.singh@example.org' in extracted_emails
-    assert 'charlie@sample.io' in extracted_emails
\ No newline at end of file
+    assert 'charlie@sample.io' in extracted_emails
+
+
+def test_find_phones_digit_count_boundaries():
+    """Runs with 7 to 15 digits are phones; shorter or longer runs are not."""
+    assert parser.find_phones('call 555-1234 now') == ['555-1234']
+    assert parser.find_phones('intl 123 456 789 012 345 ok') == ['123 456 789 012 345']
+    assert parser.find_phones('short 123-456 no') == []
+    assert parser.find_phones('serial 1234567890123456 no') == []
+
+
+def test_find_phones_run_openers():
+    """A run may open on '+' or '(' when a digit follows."""
+    assert parser.find_phones('tel +91 98765 43210') == ['+91 98765 43210']
+    assert parser.find_phones('tel (011) 2345-6789') == ['(011) 2345-6789']
+
+
+def test_find_phones_strips_trailing_separators():
+    """Trailing separator characters are stripped from the match."""
+    assert parser.find_phones('ring 555-123-4567. ') == ['555-123-4567']
+    assert parser.find_phones('ring (408) 555-7788 -- then ask') == ['(408) 555-7788']
+
+
+def test_find_phones_does_not_cross_newlines():
+    """Digit runs on separate lines never merge into one phone."""
+    assert parser.find_phones('1234\n5678') == []
+    assert parser.find_phones('555-1234\n555-6789') == ['555-1234', '555-6789']
\ No newline at end of file